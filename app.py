@@ -1,26 +1,65 @@
+import hashlib
+import os
+from functools import lru_cache
 from flask import Flask, render_template
+from flask_compress import Compress
+from jinja2 import FileSystemBytecodeCache
 
 app = Flask(__name__)
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+if not app.debug:
+    # Compile templates once per process and skip the per-render mtime check
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+app.config.update(COMPRESS_ALGORITHM=['br', 'gzip'], COMPRESS_MIN_SIZE=500, COMPRESS_LEVEL=5)
+Compress(app)
+
+# --------------------------
+# STATIC FILES
+# --------------------------
+
+# Static URLs carry a hash of the file's contents, so browsers can cache them for a year
+def _static_hash(filename):
+    try:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return None
+
+if not app.debug:
+    _static_hash = lru_cache(maxsize=None)(_static_hash)
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    if endpoint == 'static' and 'filename' in values:
+        values.setdefault('v', _static_hash(values['filename']))
 
 # --------------------------
 # HTML ROUTES
 # --------------------------
 
+# These pages take no template context, so each renders to the same HTML every time
+def _render_page(template_name):
+    return render_template(template_name)
+
+if not app.debug:
+    _render_page = lru_cache(maxsize=None)(_render_page)
+
 @app.route('/')
 def login_page():
-    return render_template('login.html')
+    return _render_page('login.html')
 
 @app.route('/dashboard')
 def dashboard_page():
-    return render_template('dashboard.html')
+    return _render_page('dashboard.html')
 
 @app.route('/enroll')
 def enroll_page():
-    return render_template('enroll.html')
+    return _render_page('enroll.html')
 
 @app.route('/take_attendance')
 def take_attendance_page():
-    return render_template('take_attendance.html')
+    return _render_page('take_attendance.html')
 
 
 # --------------------------
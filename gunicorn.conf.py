@@ -0,0 +1,27 @@
+import multiprocessing
+import os
+import shlex
+import sys
+
+from gunicorn.config import Config
+
+# Gunicorn reads this file automatically when started from the repo root:
+#   gunicorn wsgi:application
+# gevent workers let each process keep many requests in flight while they wait on the backend.
+bind = '0.0.0.0:5000'
+worker_class = 'gevent'
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_connections = 1000
+keepalive = 5
+# Load the app once in the master; forked workers share its memory copy-on-write
+# and start without re-importing anything.
+preload_app = True
+
+# -k on the command line (or in GUNICORN_CMD_ARGS) overrides worker_class above
+_cli, _ = Config().parser().parse_known_args(shlex.split(os.environ.get('GUNICORN_CMD_ARGS', '')) + sys.argv[1:])
+if 'gevent' in (_cli.worker_class or worker_class):
+    # preload_app imports the app (Flask and Werkzeug, which bring in threading and ssl)
+    # in the master before the workers fork, so gevent has to patch the standard library
+    # here rather than in each worker.
+    from gevent import monkey
+    monkey.patch_all()
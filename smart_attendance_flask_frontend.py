@@ -5,7 +5,8 @@
 # ├── README.md
 # ├── static/
 # │   ├── css/style.css
-# │   └── js/main.js
+# │   ├── js/main.js
+# │   └── vendor/bootstrap-5.3.2/
 # └── templates/
 #     ├── base.html
 #     ├── login.html
@@ -18,6 +19,13 @@
 Flask==2.3.2
 python-dotenv==1.0.0
 requests==2.31.0
+cachetools==5.3.2
+Flask-Compress==1.14
+redis==5.0.1
+Flask-Session==0.5.0
+orjson==3.9.10
+gunicorn==21.2.0
+gevent==23.9.1
 ```
 
 
@@ -39,7 +47,7 @@ requests==2.31.0
 3. Set environment variable for Flask (optional):
    ```bash
    export FLASK_APP=app.py
-   export FLASK_ENV=development
+   export FLASK_DEBUG=1
    ```
 4. Run the app:
    ```bash
@@ -54,23 +62,220 @@ Endpoints used (examples):
 - `POST /api/auth/login` -> admin login
 
 Adjust `BACKEND_URL` in `app.py` if needed.
+
+For production, run it under Gunicorn instead of the development server. `--preload`
+loads the app once in the master so the workers share it copy-on-write:
+```bash
+gunicorn --preload -k gevent -w 4 app:app
+```
+
+Set `REDIS_URL` (e.g. `redis://localhost:6379/0`) to keep sessions server-side and
+share the short-lived attendance cache between worker processes; without it sessions
+live in signed cookies and each process caches on its own.
 ```
 
 
 ### File: app.py
 ```python
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, send_file
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, Response, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from flask_session import Session
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import timedelta
+from functools import lru_cache
+import orjson
+import redis
+from cachetools import TLRUCache
+from jinja2 import FileSystemBytecodeCache
+
+
+class OrjsonProvider(JSONProvider):
+    # jsonify() and the session serializer go through orjson instead of the stdlib encoder
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get('FLASK_SECRET', 'dev-secret-please-change')
 app.permanent_session_lifetime = timedelta(hours=8)
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+if not app.debug:
+    # Compile templates once per process and skip the per-render mtime check
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+# gzip/br for pages and proxied JSON; streamed responses are left alone so /report keeps streaming
+app.config.update(
+    COMPRESS_MIMETYPES=['text/html', 'text/css', 'application/javascript', 'application/json', 'text/csv'],
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_MIN_SIZE=500,
+    COMPRESS_LEVEL=5,
+    COMPRESS_STREAMS=False,
+)
+Compress(app)
 
 # Point this to your FastAPI backend
 BACKEND_URL = os.environ.get('BACKEND_URL', 'http://localhost:8000')
 
+# One pooled client for every backend call so keep-alive connections are reused
+BACKEND = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                       max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False))
+BACKEND.mount('http://', _adapter)
+BACKEND.mount('https://', _adapter)
+# Same pool sizes but no retries, for fetches that run against a deadline
+BACKEND_ONCE = requests.Session()
+_once_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0)
+BACKEND_ONCE.mount('http://', _once_adapter)
+BACKEND_ONCE.mount('https://', _once_adapter)
+
+# Dashboard polls within this window share one backend hit per admin. With REDIS_URL set
+# the cache is shared by every worker process; otherwise each process keeps its own.
+ATTENDANCE_CACHE_TTL = 2
+# How long the last body and its ETag are kept for If-None-Match revalidation
+ATTENDANCE_ETAG_TTL = 300
+REDIS_URL = os.environ.get('REDIS_URL')
+_redis = redis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+if _redis is not None:
+    # The cookie then carries only a signed session id; admin and token stay in Redis
+    app.config.update(SESSION_TYPE='redis', SESSION_REDIS=_redis, SESSION_USE_SIGNER=True, SESSION_PERMANENT=True)
+    Session(app)
+_ATTN_CACHE = TLRUCache(maxsize=256, ttu=lambda _key, entry, now: now + entry[1])
+# cachetools caches aren't thread-safe; this guards every get/set and is never held across I/O
+_ATTN_CACHE_LOCK = threading.Lock()
+# One lock per cache key, so a slow backend fetch for one admin doesn't hold up the others
+_ATTN_LOCKS = {}
+# Runs deadline-bound fetches so the caller can stop waiting on a slow backend; its threads
+# start on first use, so with gunicorn's preload none exist before the workers fork
+_ATTN_POOL = ThreadPoolExecutor(max_workers=8)
+
+
+def _cache_get(key):
+    if _redis is None:
+        with _ATTN_CACHE_LOCK:
+            entry = _ATTN_CACHE.get(key)
+        return None if entry is None else entry[0]
+    try:
+        return _redis.get(key)
+    except redis.RedisError:
+        return None
+
+
+def _cache_set(key, value, ttl):
+    if _redis is None:
+        with _ATTN_CACHE_LOCK:
+            _ATTN_CACHE[key] = (value, ttl)
+        return
+    try:
+        _redis.setex(key, ttl, value)
+    except redis.RedisError:
+        pass
+
+
+def _load_recent_attendance(admin, headers, timeout=5, client=BACKEND, lock_timeout=-1):
+    # Returns (body, status, content type) for the admin's attendance list, going through
+    # the short cache and ETag revalidation; raises RequestException if the backend is down
+    # the admin goes last so no username can turn one kind of key into another
+    key = f'att:recent:{admin}'
+    etag_key = f'att:etag:{admin}'
+    body_key = f'att:body:{admin}'
+    body = _cache_get(key)
+    if body is None:
+        # setdefault is atomic, so concurrent misses for the same key end up on one lock
+        lock = _ATTN_LOCKS.setdefault(key, threading.Lock())
+        if not lock.acquire(timeout=lock_timeout):
+            # whoever held the lock has usually just filled the cache
+            body = _cache_get(key)
+            if body is None:
+                raise requests.exceptions.Timeout('attendance fetch already in flight')
+            return body, 200, 'application/json'
+        try:
+            body = _cache_get(key)
+            if body is None:
+                # revalidate the last body we saw instead of downloading it again
+                etag = _cache_get(etag_key)
+                stale = _cache_get(body_key) if etag else None
+                if stale is not None:
+                    headers = {**headers, 'If-None-Match': etag.decode()}
+                resp = client.get(f'{BACKEND_URL}/api/attendance', headers=headers, timeout=timeout)
+                if resp.status_code == 304 and stale is not None:
+                    body = stale
+                else:
+                    # pass the backend body through untouched rather than decoding and re-encoding it
+                    content_type = resp.headers.get('Content-Type', 'application/json')
+                    if resp.status_code != 200 or not content_type.startswith('application/json'):
+                        return resp.content, resp.status_code, content_type
+                    body = resp.content
+                    etag = resp.headers.get('ETag', '').encode() or None
+                if etag:
+                    _cache_set(etag_key, etag, ATTENDANCE_ETAG_TTL)
+                    _cache_set(body_key, body, ATTENDANCE_ETAG_TTL)
+                _cache_set(key, body, ATTENDANCE_CACHE_TTL)
+        finally:
+            lock.release()
+    return body, 200, 'application/json'
+
+
+def _fetch_recent_attendance(admin, headers, timeout=5, deadline=None):
+    # Same as _load_recent_attendance; with a deadline (seconds) the caller gets its answer
+    # or a Timeout by then, while the fetch finishes in the background and fills the cache
+    if deadline is None:
+        return _load_recent_attendance(admin, headers, timeout)
+    fut = _ATTN_POOL.submit(_load_recent_attendance, admin, headers, timeout, BACKEND_ONCE, deadline)
+    try:
+        return fut.result(timeout=deadline)
+    except FuturesTimeout:
+        raise requests.exceptions.Timeout('attendance fetch missed its deadline') from None
+
+
+# Large chunks keep the per-chunk Python overhead of streaming reports low
+REPORT_CHUNK_SIZE = 128 * 1024
+
+
+# Static URLs carry a hash of the file's contents, so browsers can cache them for a year
+def _static_hash(filename):
+    try:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return None
+
+
+if not app.debug:
+    _static_hash = lru_cache(maxsize=None)(_static_hash)
+
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    if endpoint == 'static' and 'filename' in values:
+        values.setdefault('v', _static_hash(values['filename']))
+
+
+def _render_cached(template_name, admin=None):
+    # Pages only vary by the logged-in admin (shown in the navbar); login errors come from
+    # the backend and may not be hashable, so those renders skip the cache
+    return render_template(template_name, admin=admin)
+
+
+if not app.debug:
+    _render_cached = lru_cache(maxsize=32)(_render_cached)
+
+
+def _auth_headers():
+    # Read the backend token from the session once per request
+    token = session.get('token')
+    return {'Authorization': f'Bearer {token}'} if token else {}
+
 
 @app.route('/')
 def index():
@@ -86,20 +291,20 @@ def login():
         password = request.form.get('password')
         # Forward login to backend auth endpoint (assumes token in response)
         try:
-            resp = requests.post(f'{BACKEND_URL}/api/auth/login', json={'username': username, 'password': password}, timeout=5)
+            resp = BACKEND.post(f'{BACKEND_URL}/api/auth/login', json={'username': username, 'password': password}, timeout=5)
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 token = data.get('access_token') or data.get('token')
                 session.permanent = True
                 session['admin'] = username
                 session['token'] = token
                 return redirect(url_for('dashboard'))
             else:
-                error = resp.json().get('detail', 'Login failed') if resp.headers.get('content-type','').startswith('application/json') else 'Login failed'
-                return render_template('login.html', error=error)
-        except requests.exceptions.RequestException:
-            return render_template('login.html', error='Backend unreachable')
-    return render_template('login.html')
+                error = orjson.loads(resp.content).get('detail', 'Login failed') if resp.headers.get('content-type','').startswith('application/json') else 'Login failed'
+                return render_template('login.html', admin=session.get('admin'), error=error)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+            return render_template('login.html', admin=session.get('admin'), error='Backend unreachable')
+    return _render_cached('login.html', session.get('admin'))
 
 
 @app.route('/logout')
@@ -110,58 +315,78 @@ def logout():
 
 @app.route('/dashboard')
 def dashboard():
-    if 'admin' not in session:
+    admin = session.get('admin')
+    if admin is None:
         return redirect(url_for('login'))
-    return render_template('dashboard.html', admin=session.get('admin'))
+    headers = _auth_headers()
+    # Render the first rows server-side so the page doesn't wait on a second round trip;
+    # if the backend is slow or down, the page falls back to loading them from the browser
+    rows = None
+    try:
+        body, status, _ = _fetch_recent_attendance(admin, headers, deadline=2)
+        if status == 200:
+            data = orjson.loads(body)
+            rows = data[:10] if isinstance(data, list) else []
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+        pass
+    return render_template('dashboard.html', admin=admin, rows=rows)
 
 
 @app.route('/api/attendance')
 def attendance_api_proxy():
     # Proxy endpoint to call backend and return JSON (used by client JS)
-    if 'admin' not in session:
+    admin = session.get('admin')
+    if admin is None:
         return jsonify({'detail': 'Unauthorized'}), 401
-    headers = {}
-    if session.get('token'):
-        headers['Authorization'] = f"Bearer {session['token']}"
+    headers = _auth_headers()
     try:
-        resp = requests.get(f'{BACKEND_URL}/api/attendance', headers=headers, timeout=5)
-        return jsonify(resp.json()), resp.status_code
+        body, status, content_type = _fetch_recent_attendance(admin, headers)
     except requests.exceptions.RequestException:
         return jsonify({'detail': 'Backend unreachable'}), 503
+    return Response(body, status=status, content_type=content_type)
 
 
 @app.route('/attendance')
 def attendance_page():
-    if 'admin' not in session:
+    admin = session.get('admin')
+    if admin is None:
         return redirect(url_for('login'))
-    return render_template('attendance.html')
+    return _render_cached('attendance.html', admin)
 
 
 @app.route('/report')
 def download_report():
-    if 'admin' not in session:
+    if session.get('admin') is None:
         return redirect(url_for('login'))
-    headers = {}
-    if session.get('token'):
-        headers['Authorization'] = f"Bearer {session['token']}"
+    headers = _auth_headers()
     try:
         # expect the backend to send back a CSV file or downloadable report
-        resp = requests.get(f'{BACKEND_URL}/api/attendance/report', headers=headers, timeout=10, stream=True)
+        resp = BACKEND.get(f'{BACKEND_URL}/api/attendance/report', headers=headers, timeout=10, stream=True)
         if resp.status_code == 200:
-            # save to temporary file and send
-            tmp_path = 'attendance_report.csv'
-            with open(tmp_path, 'wb') as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            return send_file(tmp_path, as_attachment=True, download_name='attendance_report.csv')
+            # stream the backend body straight through instead of spooling it to disk
+            report_headers = {'Content-Disposition': 'attachment; filename="attendance_report.csv"'}
+            encoding = resp.headers.get('Content-Encoding')
+            if encoding and encoding not in request.accept_encodings:
+                # the browser can't take the backend's compression, so send it decoded
+                chunks = resp.iter_content(chunk_size=REPORT_CHUNK_SIZE)
+            else:
+                # forward the bytes exactly as the backend sent them, compressed or not
+                chunks = resp.raw.stream(REPORT_CHUNK_SIZE, decode_content=False)
+                if encoding:
+                    report_headers['Content-Encoding'] = encoding
+                if resp.headers.get('Content-Length'):
+                    report_headers['Content-Length'] = resp.headers['Content-Length']
+            return Response(stream_with_context(chunks), mimetype='text/csv', headers=report_headers)
         else:
+            resp.close()
             return redirect(url_for('dashboard'))
     except requests.exceptions.RequestException:
         return redirect(url_for('dashboard'))
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # the reloader and debugger are for local work only; set FLASK_DEBUG=1 to turn them on
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', port=5000)
 ```
 
 
@@ -173,7 +398,7 @@ if __name__ == '__main__':
     <meta charset="utf-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1" />
     <title>{% block title %}Attendance Dashboard{% endblock %}</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link href="{{ url_for('static', filename='vendor/bootstrap-5.3.2/css/bootstrap.min.css') }}" rel="stylesheet">
     <link rel="stylesheet" href="{{ url_for('static', filename='css/style.css') }}">
   </head>
   <body>
@@ -197,7 +422,8 @@ if __name__ == '__main__':
       {% block content %}{% endblock %}
     </main>
 
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
+    <script src="{{ url_for('static', filename='vendor/bootstrap-5.3.2/js/popper.min.js') }}"></script>
+    <script src="{{ url_for('static', filename='vendor/bootstrap-5.3.2/js/bootstrap.min.js') }}"></script>
     <script src="{{ url_for('static', filename='js/main.js') }}"></script>
     {% block scripts %}{% endblock %}
   </body>
@@ -249,7 +475,19 @@ if __name__ == '__main__':
     <div class="card">
       <div class="card-body">
         <h5 class="card-title">Recent Attendance</h5>
-        <div id="attendance-table-root">Loading...</div>
+        <div id="attendance-table-root">
+          {% if rows is none %}
+            Loading...
+          {% elif rows %}
+            <div class="table-responsive"><table class="table table-sm"><thead><tr><th>#</th><th>Name</th><th>Time</th><th>Status</th></tr></thead><tbody>
+            {% for row in rows %}
+              <tr><td>{{ loop.index }}</td><td>{{ row.name or row.user or '—' }}</td><td>{{ row.time or row.timestamp or '—' }}</td><td>{{ row.status or 'Present' }}</td></tr>
+            {% endfor %}
+            </tbody></table></div>
+          {% else %}
+            <div class="text-muted">No attendance data available.</div>
+          {% endif %}
+        </div>
       </div>
     </div>
   </div>
@@ -294,7 +532,10 @@ async function loadRecentAttendance() {
   }
 }
 
+// Only fetch from the browser when the server couldn't render the rows
+{% if rows is none %}
 loadRecentAttendance();
+{% endif %}
 </script>
 {% endblock %}
 ```
@@ -313,6 +554,36 @@ loadRecentAttendance();
 {% endblock %}
 {% block scripts %}
 <script>
+// Rows are built from ALL_ROWS in batches, so large histories don't stall the page
+const PAGE_SIZE = 100;
+let ALL_ROWS = [];
+let visibleRows = [];
+let rendered = 0;
+let tbody = null;
+
+function appendRows() {
+  const frag = document.createDocumentFragment();
+  const end = Math.min(rendered + PAGE_SIZE, visibleRows.length);
+  for (let i = rendered; i < end; i++) {
+    const tr = document.createElement('tr');
+    visibleRows[i].cells.forEach(value => {
+      const td = document.createElement('td');
+      td.textContent = value;
+      tr.appendChild(td);
+    });
+    frag.appendChild(tr);
+  }
+  tbody.appendChild(frag);
+  rendered = end;
+}
+
+function renderRows() {
+  if (!tbody) return;
+  tbody.replaceChildren();
+  rendered = 0;
+  appendRows();
+}
+
 async function loadAttendance() {
   const root = document.getElementById('attendance-list');
   root.innerHTML = 'Loading...';
@@ -324,12 +595,22 @@ async function loadAttendance() {
         root.innerHTML = '<div class="text-muted">No attendance records found.</div>';
         return;
       }
-      let html = '<div class="table-responsive"><table class="table table-striped"><thead><tr><th>#</th><th>Name</th><th>ID</th><th>Time</th><th>Status</th></tr></thead><tbody>';
-      data.forEach((r, i) => {
-        html += `<tr><td>${i+1}</td><td>${r.name || r.user || '—'}</td><td>${r.user_id || r.id || '—'}</td><td>${r.time || r.timestamp || '—'}</td><td>${r.status || 'Present'}</td></tr>`;
+      ALL_ROWS = data.map((r, i) => {
+        // backend fields aren't guaranteed to be strings (e.g. a numeric user)
+        const name = String(r.name || r.user || '—');
+        return {
+          search: name.toLowerCase(),
+          cells: [i+1, name, r.user_id || r.id || '—', r.time || r.timestamp || '—', r.status || 'Present'].map(String),
+        };
       });
-      html += '</tbody></table></div>';
-      root.innerHTML = html;
+      visibleRows = ALL_ROWS;
+      root.innerHTML = '<div class="table-responsive"><table class="table table-striped"><thead><tr><th>#</th><th>Name</th><th>ID</th><th>Time</th><th>Status</th></tr></thead><tbody></tbody></table></div><div id="attendance-more"></div>';
+      tbody = root.querySelector('tbody');
+      renderRows();
+      // Append the next batch once the user scrolls near the end of the table
+      new IntersectionObserver(entries => {
+        if (entries[0].isIntersecting && rendered < visibleRows.length) appendRows();
+      }).observe(document.getElementById('attendance-more'));
     } else if (res.status === 401) {
       window.location = '/login';
     } else {
@@ -342,15 +623,16 @@ async function loadAttendance() {
 
 loadAttendance();
 
-// Basic filter
+// Basic filter, debounced and applied to the data rather than the rendered rows
 const filterInput = document.getElementById('filter-input');
+let filterTimer = null;
 filterInput.addEventListener('input', () => {
-  const q = filterInput.value.toLowerCase();
-  const rows = document.querySelectorAll('#attendance-list table tbody tr');
-  rows.forEach(r => {
-    const name = r.cells[1].textContent.toLowerCase();
-    r.style.display = name.includes(q) ? '' : 'none';
-  });
+  clearTimeout(filterTimer);
+  filterTimer = setTimeout(() => {
+    const q = filterInput.value.toLowerCase();
+    visibleRows = q ? ALL_ROWS.filter(r => r.search.includes(q)) : ALL_ROWS;
+    renderRows();
+  }, 150);
 });
 </script>
 {% endblock %}
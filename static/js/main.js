@@ -60,15 +60,18 @@ function loadAttendance() {
         { name: "Raghda Ali", date: "2025-11-22", status: "present" },
     ];
 
+    // Build every row off-DOM and attach them in one go
+    const frag = document.createDocumentFragment();
     sampleData.forEach(row => {
         const tr = document.createElement("tr");
-        tr.innerHTML = `
-            <td>${row.name}</td>
-            <td>${row.date}</td>
-            <td>${row.status}</td>
-        `;
-        tableBody.appendChild(tr);
+        [row.name, row.date, row.status].forEach(value => {
+            const td = document.createElement("td");
+            td.textContent = value;
+            tr.appendChild(td);
+        });
+        frag.appendChild(tr);
     });
+    tableBody.appendChild(frag);
 }
 
 
@@ -0,0 +1,5 @@
+from app import app
+
+# Entry point for production WSGI servers, e.g.
+#   gunicorn wsgi:application   (settings in gunicorn.conf.py)
+application = app